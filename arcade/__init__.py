@@ -121,9 +121,12 @@ from .utils import rand_vec_spread_deg
 
 from .drawing_support import calculate_hit_box_points_detailed
 from .drawing_support import calculate_hit_box_points_simple
+from .drawing_support import color_from_hex_string
 from .drawing_support import get_four_byte_color
 from .drawing_support import get_four_float_color
+from .drawing_support import get_four_float_colors
 from .drawing_support import get_points_for_thick_line
+from .drawing_support import get_points_for_thick_lines
 from .drawing_support import make_transparent_color
 from .drawing_support import rotate_point
 
@@ -345,6 +348,7 @@ __all__ = ['AStarBarrierList',
            'clamp',
            'cleanup_texture_cache',
            'close_window',
+           'color_from_hex_string',
            'create_ellipse',
            'create_ellipse_filled',
            'create_ellipse_filled_with_colors',
@@ -402,11 +406,13 @@ __all__ = ['AStarBarrierList',
            'get_distance_between_sprites',
            'get_four_byte_color',
            'get_four_float_color',
+           'get_four_float_colors',
            'get_game_controllers',
            'get_image',
            'get_joysticks',
            'get_pixel',
            'get_points_for_thick_line',
+           'get_points_for_thick_lines',
            'get_projection',
            'get_rectangle_points',
            'get_scaling_factor',
@@ -4,17 +4,32 @@ Functions used to support drawing. No Pyglet/OpenGL here.
 
 import math
 
+from functools import lru_cache
+
+import numpy as np
+
 import pymunk
 
 from PIL import Image
 
 from pymunk import autogeometry
 
-from typing import List, Tuple, cast
+from typing import List, Tuple
 
 from arcade import Color
 from arcade import RGBA
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_INV_255 = np.float32(1.0 / 255.0)
+
+# Bound once so hot paths pay a local load instead of a module
+# attribute lookup per call
+_sqrt = math.sqrt
+
 
 def get_points_for_thick_line(start_x: float, start_y: float,
                               end_x: float, end_y: float,
@@ -26,27 +41,113 @@ def get_points_for_thick_line(start_x: float, start_y: float,
     """
     vector_x = start_x - end_x
     vector_y = start_y - end_y
-    perpendicular_x = vector_y
-    perpendicular_y = -vector_x
-    length = math.sqrt(vector_x * vector_x + vector_y * vector_y)
-    if length == 0:
-        normal_x = 1.0
-        normal_y = 1.0
-    else:
-        normal_x = perpendicular_x / length
-        normal_y = perpendicular_y / length
-    r1_x = start_x + normal_x * line_width / 2
-    r1_y = start_y + normal_y * line_width / 2
-    r2_x = start_x - normal_x * line_width / 2
-    r2_y = start_y - normal_y * line_width / 2
-    r3_x = end_x + normal_x * line_width / 2
-    r3_y = end_y + normal_y * line_width / 2
-    r4_x = end_x - normal_x * line_width / 2
-    r4_y = end_y - normal_y * line_width / 2
+    # Multiply by the reciprocal of the length instead of dividing
+    # each component. One divide instead of two, and the half-width
+    # offsets below are computed once instead of per corner. The tiny
+    # epsilon makes the zero-length case branchless: such a line
+    # collapses to a zero-width quad instead of a bogus diagonal.
+    inv_length = 1.0 / (_sqrt(vector_x * vector_x + vector_y * vector_y)
+                        + 1e-30)
+    normal_x = vector_y * inv_length
+    normal_y = -vector_x * inv_length
+    half_width = line_width / 2
+    half_x = normal_x * half_width
+    half_y = normal_y * half_width
+    r1_x = start_x + half_x
+    r1_y = start_y + half_y
+    r2_x = start_x - half_x
+    r2_y = start_y - half_y
+    r3_x = end_x + half_x
+    r3_y = end_y + half_y
+    r4_x = end_x - half_x
+    r4_y = end_y - half_y
     points = (r1_x, r1_y), (r2_x, r2_y), (r4_x, r4_y), (r3_x, r3_y)
     return points
 
 
+def _thick_line_corners(starts: np.ndarray,
+                        ends: np.ndarray,
+                        widths: np.ndarray,
+                        out: np.ndarray) -> None:
+    """
+    Tight-loop kernel behind :func:`get_points_for_thick_lines`.
+    Compiled with Numba when it is installed.
+    """
+    for index in range(starts.shape[0]):
+        vector_x = starts[index, 0] - ends[index, 0]
+        vector_y = starts[index, 1] - ends[index, 1]
+        length = math.sqrt(vector_x * vector_x + vector_y * vector_y)
+        inv_length = 1.0 / (length + 1e-30)
+        normal_x = vector_y * inv_length
+        normal_y = -vector_x * inv_length
+        half_x = normal_x * widths[index] * 0.5
+        half_y = normal_y * widths[index] * 0.5
+        out[index, 0, 0] = starts[index, 0] + half_x
+        out[index, 0, 1] = starts[index, 1] + half_y
+        out[index, 1, 0] = starts[index, 0] - half_x
+        out[index, 1, 1] = starts[index, 1] - half_y
+        out[index, 2, 0] = ends[index, 0] - half_x
+        out[index, 2, 1] = ends[index, 1] - half_y
+        out[index, 3, 0] = ends[index, 0] + half_x
+        out[index, 3, 1] = ends[index, 1] + half_y
+
+
+if njit is not None:
+    _thick_line_corners = njit(
+        "void(f8[:, :], f8[:, :], f8[:], f8[:, :, :])",
+        cache=True, fastmath=True)(_thick_line_corners)
+
+
+def get_points_for_thick_lines(starts: np.ndarray,
+                               ends: np.ndarray,
+                               widths: np.ndarray) -> np.ndarray:
+    """
+    Batched version of :func:`get_points_for_thick_line`. Calculates the
+    rectangle corners for many thick lines at once with NumPy instead of
+    looping over each line in Python. If Numba is installed the loop is
+    JIT-compiled instead.
+
+    :param starts: (N, 2) array of line start points
+    :param ends: (N, 2) array of line end points
+    :param widths: (N, ) array of line widths
+
+    :returns: (N, 4, 2) array of corner points in the same order the
+              single-line function returns them.
+    """
+    starts = np.ascontiguousarray(starts, dtype=np.float64)
+    ends = np.ascontiguousarray(ends, dtype=np.float64)
+    widths = np.ascontiguousarray(widths, dtype=np.float64)
+
+    if njit is not None:
+        points = np.empty((len(starts), 4, 2), dtype=np.float64)
+        _thick_line_corners(starts, ends, widths, points)
+        return points
+
+    vector_x = starts[:, 0] - ends[:, 0]
+    vector_y = starts[:, 1] - ends[:, 1]
+    length = np.sqrt(vector_x * vector_x + vector_y * vector_y)
+
+    # Same branchless epsilon as the scalar function: no masking
+    # needed, and zero-length lines collapse to zero-width quads.
+    inv_length = 1.0 / (length + 1e-30)
+    normal_x = vector_y * inv_length
+    normal_y = -vector_x * inv_length
+
+    half_x = normal_x * widths * 0.5
+    half_y = normal_y * widths * 0.5
+
+    points = np.empty((len(starts), 4, 2), dtype=np.float64)
+    points[:, 0, 0] = starts[:, 0] + half_x
+    points[:, 0, 1] = starts[:, 1] + half_y
+    points[:, 1, 0] = starts[:, 0] - half_x
+    points[:, 1, 1] = starts[:, 1] - half_y
+    points[:, 2, 0] = ends[:, 0] - half_x
+    points[:, 2, 1] = ends[:, 1] - half_y
+    points[:, 3, 0] = ends[:, 0] + half_x
+    points[:, 3, 1] = ends[:, 1] + half_y
+    return points
+
+
 def get_four_byte_color(color: Color) -> RGBA:
     """
     Given a RGB list, it will return RGBA.
@@ -57,14 +158,52 @@ def get_four_byte_color(color: Color) -> RGBA:
     :returns:  return: Four byte RGBA tuple
     """
 
-    if len(color) == 4:
-        return cast(RGBA, color)
-    elif len(color) == 3:
-        return color[0], color[1], color[2], 255
+    size = len(color)
+    if size == 4:
+        return color  # type: ignore
+    elif size == 3:
+        return (*color, 255)
     else:
         raise ValueError("This isn't a 3 or 4 byte color")
 
 
+@lru_cache(maxsize=256)
+def color_from_hex_string(code: str) -> RGBA:
+    """
+    Make a color from a hex code string. Supports 3, 4, 6 and 8 digit
+    hex codes, with or without a leading ``#``.
+
+    :param str code: Hex code such as ``'00ff00'`` or ``'#00ff00ff'``
+
+    :returns: Four byte RGBA tuple
+    """
+    original = code
+    code = code.lstrip("#")
+
+    # Expand short-form CSS codes with straight-line concatenation:
+    # no generator object or str.join call per parse.
+    size = len(code)
+    if size == 3:
+        code = code[0] * 2 + code[1] * 2 + code[2] * 2
+    elif size == 4:
+        code = code[0] * 2 + code[1] * 2 + code[2] * 2 + code[3] * 2
+
+    # bytes.fromhex parses the whole string in one C call and also
+    # validates the hex digits for us. It skips ASCII whitespace,
+    # though, so check the decoded byte count instead of trusting the
+    # string length.
+    if len(code) == 6:
+        channels = bytes.fromhex(code)
+        if len(channels) == 3:
+            return channels[0], channels[1], channels[2], 255
+    elif len(code) == 8:
+        channels = bytes.fromhex(code)
+        if len(channels) == 4:
+            return channels[0], channels[1], channels[2], channels[3]
+
+    raise ValueError(f"Improperly formatted color: '{original}'")
+
+
 def get_four_float_color(color: Color) -> Tuple[float, float, float, float]:
     """
     Given a 3 or 4 RGB/RGBA color where each color goes 0-255, this
@@ -81,6 +220,30 @@ def get_four_float_color(color: Color) -> Tuple[float, float, float, float]:
         raise ValueError("This isn't a 3 or 4 byte color")
 
 
+def get_four_float_colors(colors: np.ndarray) -> np.ndarray:
+    """
+    Batched version of :func:`get_four_float_color`. Scales a whole
+    array of byte colors to 0.0-1.0 floats in one NumPy call instead
+    of three or four Python divides per color.
+
+    :param colors: (N, 3) or (N, 4) array of 0-255 color components
+    :return: (N, 4) float32 array of RGBA colors
+    """
+    colors = np.asarray(colors)
+    if colors.ndim != 2 or colors.shape[1] not in (3, 4):
+        raise ValueError("This isn't an array of 3 or 4 byte colors")
+
+    # Multiply by the reciprocal in float32: dividing by 255 directly
+    # would promote the whole array to float64.
+    scaled = colors.astype(np.float32) * _INV_255
+    if colors.shape[1] == 4:
+        return scaled
+
+    out = np.ones((len(scaled), 4), dtype=np.float32)
+    out[:, :3] = scaled
+    return out
+
+
 def make_transparent_color(color: Color, transparency: float):
     """
     Given a RGB color, along with an alpha, returns a RGBA color tuple.
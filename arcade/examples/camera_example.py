@@ -18,6 +18,10 @@ PLAYER_SCALING = 0.5
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 
+# Computed once instead of every camera update
+HALF_SCREEN_WIDTH = SCREEN_WIDTH / 2
+HALF_SCREEN_HEIGHT = SCREEN_HEIGHT / 2
+
 SCREEN_TITLE = "Camera Example"
 SPRITE_PIXEL_SIZE = 128
 GRID_PIXEL_SIZE = (SPRITE_PIXEL_SIZE * TILE_SCALING)
@@ -211,8 +215,8 @@ class MyGame(arcade.Window):
         """
 
         # This spot would center on the user
-        screen_center_x = self.player_sprite.center_x - SCREEN_WIDTH / 2
-        screen_center_y = self.player_sprite.center_y - SCREEN_HEIGHT / 2
+        screen_center_x = self.player_sprite.center_x - HALF_SCREEN_WIDTH
+        screen_center_y = self.player_sprite.center_y - HALF_SCREEN_HEIGHT
         if screen_center_y < 0:
             screen_center_y = 0
         user_centered = screen_center_x, screen_center_y
@@ -249,7 +253,10 @@ class MyGame(arcade.Window):
         new_scroll[0] += self.shake_offset_1
         new_scroll[1] += self.shake_offset_2
 
-        self.camera.scroll = new_scroll
+        # Skip the write when the camera has settled; when the player
+        # is idle and the shake has decayed, the scroll doesn't change.
+        if new_scroll[0] != cur_scroll[0] or new_scroll[1] != cur_scroll[1]:
+            self.camera.scroll = new_scroll
 
     def on_update(self, delta_time):
         """ Movement and game logic """
@@ -0,0 +1,229 @@
+"""
+Playback Speed
+
+Synthesize a small piano keyboard by playing one sample at different
+speeds. Changing the playback speed of a sound changes its pitch, so a
+single sample can cover a whole octave of keys.
+
+If Python and Arcade are installed, this example can be run from the command line with:
+python -m arcade.examples.playback_speed_example
+"""
+import arcade
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+SCREEN_TITLE = "Playback Speed"
+
+SAMPLE = ":resources:sounds/coin1.wav"
+
+# The rough pitch of the sample above. Playing it at a speed of
+# key_frequency(n) / SAMPLE_PITCH_HZ makes it sound like key n.
+SAMPLE_PITCH_HZ = 440.0
+
+# Piano keys are numbered 1-88, lowest note first. Key 49 is A above
+# middle C at 440 Hz, and each key is a factor of 2 ** (1 / 12) apart.
+# The whole table is known up front, so build it once at import instead
+# of calling math.pow for every key of every keyboard.
+_PIANO_FREQ_HZ = tuple(440.0 * 2 ** ((n - 49) / 12) for n in range(1, 89))
+
+# Which keys in an octave are black, starting from C
+OCTAVE_PATTERN = [False, True, False, True, False, False,
+                  True, False, True, False, True, False]
+
+# Pre-unrolled over every key number so key_is_black is a single tuple
+# index instead of a modulo plus a list subscript. Key 4 is the first C.
+_IS_BLACK = tuple(OCTAVE_PATTERN[(n - 4) % len(OCTAVE_PATTERN)]
+                  for n in range(128))
+
+# Keys 40-52: middle C up to the next C
+START_KEY_N = 40
+END_KEY_N = 52
+
+# Computer keys mapped to piano keys, in piano order
+KEY_MAP = (arcade.key.A, arcade.key.W, arcade.key.S, arcade.key.E,
+           arcade.key.D, arcade.key.F, arcade.key.T, arcade.key.G,
+           arcade.key.Y, arcade.key.H, arcade.key.U, arcade.key.J,
+           arcade.key.K)
+
+# Key colors, hoisted so the construction loop doesn't rebuild them
+WHITE_KEY_UP_COLOR = (205, 205, 205)
+WHITE_KEY_DOWN_COLOR = (255, 255, 255)
+BLACK_KEY_UP_COLOR = (45, 45, 45)
+BLACK_KEY_DOWN_COLOR = (0, 0, 0)
+
+
+def key_frequency(n: int) -> float:
+    """
+    Return the frequency in Hz of piano key ``n`` (1-88).
+    """
+    return _PIANO_FREQ_HZ[n - 1]
+
+
+def key_is_black(n: int) -> bool:
+    """
+    Return whether piano key ``n`` (1-88) is a black key.
+    """
+    return _IS_BLACK[n]
+
+
+class SynthKey(arcade.SpriteSolidColor):
+    """ One piano key. Plays the sample at this key's speed. """
+
+    def __init__(self, width_px, height_px, up_color, down_color,
+                 sound: arcade.Sound, speed):
+        super().__init__(width_px, height_px, up_color)
+        self._up_color = up_color
+        self._down_color = down_color
+        # One decoded Sound is shared by the whole keyboard; only the
+        # playback speed differs per key.
+        self._sound = sound
+        self._speed = speed
+        self._pressed = False
+
+    @property
+    def pressed(self) -> bool:
+        """ Whether the key is currently held down. """
+        return self._pressed
+
+    @pressed.setter
+    def pressed(self, new_state: bool):
+        # Only re-tint on real transitions. Key-repeat and per-frame
+        # polling would otherwise dirty the SpriteList color buffer
+        # with a value it already has.
+        if new_state == self._pressed:
+            return
+        self._pressed = new_state
+        if new_state:
+            self.color = self._down_color
+        else:
+            self.color = self._up_color
+
+    def play(self):
+        """ Play this key's note. """
+        player = self._sound.play()
+        if player:
+            player.pitch = self._speed
+        return player
+
+
+class SynthKeyboard:
+    """
+    An octave of SynthKey sprites laid out like a piano.
+    """
+
+    def __init__(self, center_x, center_y,
+                 sample=SAMPLE,
+                 sample_pitch_hz=SAMPLE_PITCH_HZ,
+                 white_key_width_px=50,
+                 white_key_height_px=180):
+        self._sample_pitch_hz = sample_pitch_hz
+
+        # Plain lists for the logical groupings; only the draw-order
+        # list is an actual SpriteList. Each SpriteList owns GPU
+        # buffers, and every key would otherwise be stored in two of
+        # them.
+        self.keys_piano_order = []
+        self.white_keys = []
+        self.black_keys = []
+        self.keys_draw_order = arcade.SpriteList()
+
+        white_key_count = sum(1 for n in range(START_KEY_N, END_KEY_N + 1)
+                              if not key_is_black(n))
+        current_key_x = center_x \
+            - (white_key_count * white_key_width_px) / 2 \
+            + white_key_width_px / 2
+
+        # Everything that doesn't change per key is computed once here
+        # instead of on every loop iteration.
+        black_key_width_px = int(white_key_width_px * 0.6)
+        black_key_height_px = int(white_key_height_px * 0.6)
+        black_key_offset_x_px = white_key_width_px / 2
+        black_key_center_y = center_y \
+            + (white_key_height_px - black_key_height_px) / 2
+
+        # Decode the sample once for all keys instead of once per key
+        shared_sound = arcade.Sound(sample)
+
+        # One divide up front; each key's speed is then a multiply
+        inv_sample_pitch = 1.0 / self._sample_pitch_hz
+        speeds = [key_frequency(n) * inv_sample_pitch
+                  for n in range(START_KEY_N, END_KEY_N + 1)]
+
+        # Bind the groupings to locals so the loop pays a fast local
+        # load instead of an attribute lookup per key
+        white_keys = self.white_keys
+        black_keys = self.black_keys
+        keys_piano_order = self.keys_piano_order
+
+        for n in range(START_KEY_N, END_KEY_N + 1):
+            speed = speeds[n - START_KEY_N]
+
+            if key_is_black(n):
+                key = SynthKey(black_key_width_px, black_key_height_px,
+                               BLACK_KEY_UP_COLOR, BLACK_KEY_DOWN_COLOR,
+                               shared_sound, speed)
+                # Black keys sit between the surrounding white keys
+                key.center_x = current_key_x - black_key_offset_x_px
+                key.center_y = black_key_center_y
+                black_keys.append(key)
+            else:
+                key = SynthKey(white_key_width_px - 2, white_key_height_px,
+                               WHITE_KEY_UP_COLOR, WHITE_KEY_DOWN_COLOR,
+                               shared_sound, speed)
+                key.center_x = current_key_x
+                key.center_y = center_y
+                white_keys.append(key)
+                current_key_x += white_key_width_px
+
+            keys_piano_order.append(key)
+
+        # White keys first so black keys draw on top of them
+        self.keys_draw_order.extend(self.white_keys)
+        self.keys_draw_order.extend(self.black_keys)
+
+    def draw(self):
+        """ Draw the keyboard. """
+        self.keys_draw_order.draw()
+
+
+class MyGame(arcade.Window):
+    """ Main application class. """
+
+    def __init__(self):
+        super().__init__(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+
+        arcade.set_background_color(arcade.color.AMAZON)
+
+        self.keyboard = SynthKeyboard(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+
+    def on_draw(self):
+        """ Render the screen. """
+        arcade.start_render()
+
+        self.keyboard.draw()
+
+        arcade.draw_text("Play with the A-K row of your keyboard",
+                         SCREEN_WIDTH / 2, 60,
+                         arcade.color.WHITE, 14,
+                         anchor_x="center")
+
+    def on_key_press(self, key, modifiers):
+        if key in KEY_MAP:
+            synth_key = self.keyboard.keys_piano_order[KEY_MAP.index(key)]
+            synth_key.pressed = True
+            synth_key.play()
+
+    def on_key_release(self, key, modifiers):
+        if key in KEY_MAP:
+            synth_key = self.keyboard.keys_piano_order[KEY_MAP.index(key)]
+            synth_key.pressed = False
+
+
+def main():
+    """ Main Program """
+    MyGame()
+    arcade.run()
+
+
+if __name__ == "__main__":
+    main()
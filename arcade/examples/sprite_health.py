@@ -7,6 +7,8 @@ If Python and Arcade are installed, this example can be run from the command lin
 python -m arcade.examples.sprite_health
 """
 import random
+from functools import lru_cache
+
 import arcade
 
 SPRITE_SCALING_PLAYER = 0.5
@@ -28,15 +30,127 @@ HEALTH_NUMBER_OFFSET_X = -10
 HEALTH_NUMBER_OFFSET_Y = -25
 
 
+@lru_cache(maxsize=16)
+def _get_bar_texture(size_px: int = 4):
+    """
+    Return a small shared white texture for health bar sprites.
+
+    All bar sprites reference this one texture and are recolored with
+    the sprite color tint, so building hundreds of bars uploads one
+    tiny texture instead of one texture per bar.
+    """
+    return arcade.make_soft_square_texture(size_px, arcade.color.WHITE,
+                                           center_alpha=255, outer_alpha=255)
+
+
+def _make_tinted_rect(width: float, height: float, color) -> arcade.Sprite:
+    """ Create a bar piece: a tinted rectangle over the shared texture. """
+    sprite = arcade.Sprite()
+    sprite.texture = _get_bar_texture()
+    sprite.width = width
+    sprite.height = height
+    sprite.color = color
+    return sprite
+
+
+class IndicatorBar:
+    """
+    A health bar made of two tinted sprites in a shared SpriteList.
+
+    All bars on screen render in one batched draw call, instead of two
+    draw_rectangle_filled calls per unit per frame.
+    """
+
+    def __init__(self, sprite_list: arcade.SpriteList,
+                 center_x: float = 0, center_y: float = 0,
+                 width: float = HEALTHBAR_WIDTH,
+                 height: float = HEALTHBAR_HEIGHT,
+                 full_color=arcade.color.GREEN,
+                 background_color=arcade.color.RED):
+        self.sprite_list = sprite_list
+
+        self._center_x = center_x
+        self._center_y = center_y
+        self._width = width
+        self._fullness = 1.0
+
+        self.background_box = _make_tinted_rect(width, height, background_color)
+        self.full_box = _make_tinted_rect(width, height, full_color)
+        sprite_list.append(self.background_box)
+        sprite_list.append(self.full_box)
+
+        self._place_boxes()
+
+    def _place_boxes(self):
+        """ Move the bar sprites to match position and fullness. """
+        self.background_box.position = self._center_x, self._center_y
+        # Keep the full part left-aligned as it shrinks
+        self.full_box.center_x = \
+            self._center_x - 0.5 * self._width * (1 - self._fullness)
+        self.full_box.center_y = self._center_y
+
+    @property
+    def position(self):
+        """ Center (x, y) of the bar. """
+        return self._center_x, self._center_y
+
+    @position.setter
+    def position(self, new_position):
+        # Most frames the owner hasn't moved. Skip the sprite writes so
+        # the SpriteList buffers aren't flagged dirty for nothing.
+        if new_position[0] == self._center_x and \
+                new_position[1] == self._center_y:
+            return
+        self._center_x, self._center_y = new_position
+        self._place_boxes()
+
+    @property
+    def fullness(self) -> float:
+        """ How full the bar is, from 0.0 (empty) to 1.0 (full). """
+        return self._fullness
+
+    @fullness.setter
+    def fullness(self, new_fullness: float):
+        if new_fullness == self._fullness:
+            return
+        if not 0.0 <= new_fullness <= 1.0:
+            raise ValueError(f"Got {new_fullness}, but fullness must be "
+                             f"between 0 and 1.")
+        self._fullness = new_fullness
+        if new_fullness == 0:
+            # Hide the full bar rather than giving it zero width
+            self.full_box.alpha = 0
+        else:
+            self.full_box.alpha = 255
+            self.full_box.width = self._width * new_fullness
+            self._place_boxes()
+
+    def remove_from_sprite_lists(self):
+        """ Remove the bar sprites from the shared sprite list. """
+        self.background_box.remove_from_sprite_lists()
+        self.full_box.remove_from_sprite_lists()
+
+
 class SpriteWithHealth(arcade.Sprite):
-    """ Sprite with hit points """
+    """ Sprite with hit points and an attached health bar """
 
-    def __init__(self, image, scale, max_health):
+    def __init__(self, image, scale, max_health, bar_list):
         super().__init__(image, scale)
 
         # Add extra attributes for health
         self.max_health = max_health
         self.cur_health = max_health
+        self.indicator_bar = IndicatorBar(bar_list)
+
+    def update_health_bar(self):
+        """ Sync the health bar with position and current health """
+        self.indicator_bar.position = (self.center_x,
+                                       self.center_y + HEALTHBAR_OFFSET_Y)
+        self.indicator_bar.fullness = self.cur_health / self.max_health
+
+    def remove_from_sprite_lists(self):
+        self.indicator_bar.remove_from_sprite_lists()
+        super().remove_from_sprite_lists()
 
     def draw_health_number(self):
         """ Draw how many hit points we have """
@@ -48,25 +162,6 @@ class SpriteWithHealth(arcade.Sprite):
                          font_size=12,
                          color=arcade.color.WHITE)
 
-    def draw_health_bar(self):
-        """ Draw the health bar """
-
-        # Draw the 'unhealthy' background
-        if self.cur_health < self.max_health:
-            arcade.draw_rectangle_filled(center_x=self.center_x,
-                                         center_y=self.center_y + HEALTHBAR_OFFSET_Y,
-                                         width=HEALTHBAR_WIDTH,
-                                         height=3,
-                                         color=arcade.color.RED)
-
-        # Calculate width based on health
-        health_width = HEALTHBAR_WIDTH * (self.cur_health / self.max_health)
-
-        arcade.draw_rectangle_filled(center_x=self.center_x - 0.5 * (HEALTHBAR_WIDTH - health_width),
-                                     center_y=self.center_y - 10,
-                                     width=health_width,
-                                     height=HEALTHBAR_HEIGHT,
-                                     color=arcade.color.GREEN)
 
 class MyGame(arcade.Window):
     """ Main application class. """
@@ -80,6 +175,7 @@ class MyGame(arcade.Window):
         self.player_list = None
         self.coin_list = None
         self.bullet_list = None
+        self.bar_list = None
 
         # Set up the player info
         self.player_sprite = None
@@ -103,6 +199,7 @@ class MyGame(arcade.Window):
         self.player_list = arcade.SpriteList()
         self.coin_list = arcade.SpriteList()
         self.bullet_list = arcade.SpriteList()
+        self.bar_list = arcade.SpriteList()
 
         # Set up the player
         self.score = 0
@@ -120,11 +217,13 @@ class MyGame(arcade.Window):
             # Coin image from kenney.nl
             coin = SpriteWithHealth(":resources:images/items/coinGold.png",
                                     SPRITE_SCALING_COIN,
-                                    max_health=5)
+                                    max_health=5,
+                                    bar_list=self.bar_list)
 
             # Position the coin
             coin.center_x = random.randrange(SCREEN_WIDTH)
             coin.center_y = random.randrange(150, SCREEN_HEIGHT)
+            coin.update_health_bar()
 
             # Add the coin to the lists
             self.coin_list.append(coin)
@@ -145,9 +244,11 @@ class MyGame(arcade.Window):
         self.bullet_list.draw()
         self.player_list.draw()
 
+        # All health bars draw in one batch
+        self.bar_list.draw()
+
         for coin in self.coin_list:
             coin.draw_health_number()
-            coin.draw_health_bar()
 
         # Render the text
         arcade.draw_text(f"Score: {self.score}", 10, 20, arcade.color.WHITE, 14)
@@ -205,6 +306,7 @@ class MyGame(arcade.Window):
 
                 # Remove one health point
                 coin.cur_health -= 1
+                coin.update_health_bar()
 
                 # Check health
                 if coin.cur_health <= 0:
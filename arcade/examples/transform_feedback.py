@@ -15,10 +15,9 @@ Using transforms in this way makes us able to process
 a system that is reacting to external forces in this way.
 There are no predetermined paths and they system just lives on its own.
 """
-from array import array
 import math
 import time
-import random
+import numpy as np
 import arcade
 from arcade.gl import BufferDescription, geometry
 
@@ -98,7 +97,7 @@ class MyGame(arcade.Window):
         )
         N = 50_000
         # Make two buffers we tranform between so we can work on the previous result
-        self.buffer_1 = self.ctx.buffer(data=array('f', self.gen_initial_data(N)))
+        self.buffer_1 = self.ctx.buffer(data=self.gen_initial_data(N))
         self.buffer_2 = self.ctx.buffer(reserve=self.buffer_1.size)
 
         # We also need to be able to visualize both versions (draw to the screen)
@@ -109,15 +108,27 @@ class MyGame(arcade.Window):
         self.gravity_1 = self.ctx.geometry([BufferDescription(self.buffer_1, '2f 2f', ['in_pos', 'in_vel'])])
         self.gravity_2 = self.ctx.geometry([BufferDescription(self.buffer_2, '2f 2f', ['in_pos', 'in_vel'])])
 
+        # Pair the ping-pong roles up once: each entry is the geometry
+        # to transform, the buffer it writes into, and the vao that
+        # draws that buffer. on_draw flips an index between the two
+        # instead of re-assigning three attribute pairs every frame.
+        self.pingpong = (
+            (self.gravity_1, self.buffer_2, self.vao_2),
+            (self.gravity_2, self.buffer_1, self.vao_1),
+        )
+        self.frame = 0
+
         self.ctx.enable_only()  # Ensure no context flags are set
         self.time = time.time()
 
     def gen_initial_data(self, count):
-        for _ in range(count):
-            yield random.uniform(-1.2, 1.2)  # pos x
-            yield random.uniform(-1.2, 1.2)  # pos y
-            yield random.uniform(-.3, .3)  # velocity x
-            yield random.uniform(-.3, .3)  # velocity y
+        # Fill positions and velocities for all points in two bulk
+        # numpy draws instead of four random.uniform calls per point
+        rng = np.random.default_rng()
+        data = np.empty((count, 4), dtype=np.float32)
+        data[:, 0:2] = rng.uniform(-1.2, 1.2, (count, 2))  # pos x, y
+        data[:, 2:4] = rng.uniform(-.3, .3, (count, 2))  # velocity x, y
+        return data.tobytes()
 
     def on_draw(self):
         self.clear()
@@ -133,15 +144,14 @@ class MyGame(arcade.Window):
         self.gravity_program['force'] = 0.25
         self.gravity_program['gravity_pos'] = math.sin(self.time * 0.77) * 0.25, math.cos(self.time) * 0.25
 
-        # Transform data in buffer_1 into buffer_2
-        self.gravity_1.transform(self.gravity_program, self.buffer_2)
-        # Render the result (Draw buffer_2)
-        self.vao_2.render(self.points_progran, mode=self.ctx.POINTS)
+        # Transform one buffer into the other and draw the result.
+        # The roles alternate each frame via the precomputed pairs.
+        gravity, target_buffer, vao = self.pingpong[self.frame]
+        gravity.transform(self.gravity_program, target_buffer)
+        vao.render(self.points_progran, mode=self.ctx.POINTS)
 
-        # Swap around stuff around so we transform back and fourth between the two buffers
-        self.gravity_1, self.gravity_2 = self.gravity_2, self.gravity_1
-        self.vao_1, self.vao_2 = self.vao_2, self.vao_1
-        self.buffer_1, self.buffer_2 = self.buffer_2, self.buffer_1
+        # Flip so next frame transforms back the other way
+        self.frame ^= 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,532 @@
+"""
+Experimental glyph texture tables.
+
+A texture table maps single-character strings to :class:`Texture`
+objects, so bitmap-font style text can be drawn with sprites. Tables
+can be rasterized from a system font or sliced out of a monospace
+spritesheet, and a whole table can be packed into one atlas texture
+instead of one texture per character.
+
+API may change.
+"""
+import hashlib
+import json
+import os
+import string
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import PIL.Image
+import pyglet
+
+import arcade
+from arcade import Color, Texture
+from arcade.text import get_text_image
+
+# A texture table maps single characters to their textures
+TextureTable = Dict[str, Texture]
+
+# A glyph selection is a string of characters, or an iterable of
+# strings to concatenate into one
+GlyphSelection = Union[str, Iterable[str]]
+
+# Per-glyph pixel rectangles inside an atlas: (x, y, width, height)
+GlyphRects = Dict[str, Tuple[int, int, int, int]]
+
+# The first 256 code points are exactly latin-1, so decoding builds
+# the string in one C loop instead of a 256-iteration chr() listcomp.
+ASCII_WITH_LATIN_1 = bytes(range(256)).decode("latin-1")
+
+DEFAULT_FONT_NAME = "Arial"
+DEFAULT_FONT_SIZE = 12
+
+
+def flatten_glyph_selection(selection: GlyphSelection) -> str:
+    """
+    Flatten a glyph selection into a single string of characters.
+
+    :param GlyphSelection selection: A string, or an iterable of strings
+    :returns: The selection as one string
+    """
+    # Every builder defaults to ASCII_WITH_LATIN_1, so recognize the
+    # constant by identity before any per-element work
+    if selection is ASCII_WITH_LATIN_1:
+        return ASCII_WITH_LATIN_1
+    if isinstance(selection, str):
+        return selection
+
+    # str.join does the per-element type check in C, so the happy path
+    # runs no Python-level isinstance calls. Only on failure do we make
+    # a second pass to report which element was bad.
+    elements = tuple(selection)
+    try:
+        return "".join(elements)
+    except TypeError:
+        for index, element in enumerate(elements):
+            if not isinstance(element, str):
+                raise TypeError(
+                    f"Expected a str at index {index} of the selection, "
+                    f"but got {element!r}") from None
+        raise
+
+
+@lru_cache(maxsize=4096)
+def _render_glyph_texture(glyph: str,
+                          font_name: str,
+                          font_size: int,
+                          font_color: Tuple[int, ...]) -> Texture:
+    """ Rasterize one glyph; results are memoized per argument set. """
+    try:
+        # pyglet keeps the font face loaded and rasterizes through the
+        # platform's native glyph path, skipping PIL's full text
+        # layout machinery.
+        font = _load_pyglet_font(font_name, font_size)
+        pyglet_glyph = font.get_glyphs(glyph)[0]
+        image = _glyph_image_from_pyglet(pyglet_glyph)
+        image = _tint_glyph_image(image, font_color)
+    except Exception:
+        # No GL context or font backend: lay the glyph out with PIL
+        image = get_text_image(glyph,
+                               text_color=font_color,
+                               font_size=font_size,
+                               font_name=font_name)
+    # The color is part of the name: SpriteList atlases deduplicate
+    # textures by name, so two colors of one glyph must not collide
+    tex_name = f"glyph-{font_name}-{font_size}-{font_color}-{ord(glyph):#x}"
+    return Texture(tex_name, image, hit_box_algorithm="None")
+
+
+def render_glyph_texture_from_system_font(
+        glyph: str,
+        font_name: str = DEFAULT_FONT_NAME,
+        font_size: int = DEFAULT_FONT_SIZE,
+        font_color: Color = arcade.color.WHITE) -> Texture:
+    """
+    Rasterize a single glyph with a system font and wrap it in a
+    :class:`Texture`.
+
+    Results are memoized, so repeated calls for the same glyph return
+    the same shared :class:`Texture` instead of rasterizing again.
+
+    :param str glyph: A single-character string
+    :param str font_name: Name of the system font to use
+    :param int font_size: Size of the font in points
+    :param Color font_color: Color to render the glyph with
+    :returns: The :class:`Texture` for the glyph
+    """
+    # Color may be a list, which can't be an lru_cache key
+    return _render_glyph_texture(glyph, font_name, font_size,
+                                 tuple(font_color))
+
+
+@lru_cache(maxsize=8)
+def _load_pyglet_font(font_name: str, font_size: int):
+    """ Load a pyglet font face once per (name, size). """
+    return pyglet.font.load(font_name, font_size)
+
+
+def _glyph_image_from_pyglet(pyglet_glyph) -> PIL.Image.Image:
+    """ Convert a rasterized pyglet glyph into a PIL image. """
+    image_data = pyglet_glyph.get_image_data()
+    image = PIL.Image.frombytes(
+        "RGBA",
+        (image_data.width, image_data.height),
+        image_data.get_data("RGBA", image_data.width * 4))
+    # pyglet image rows run bottom to top
+    return image.transpose(PIL.Image.FLIP_TOP_BOTTOM)
+
+
+def _tint_glyph_image(image: PIL.Image.Image,
+                      font_color: Color) -> PIL.Image.Image:
+    """ Recolor a white-on-transparent glyph image. """
+    red, green, blue, _alpha = arcade.get_four_byte_color(font_color)
+    if (red, green, blue) == (255, 255, 255):
+        return image
+    tinted = PIL.Image.new("RGBA", image.size, (red, green, blue, 255))
+    tinted.putalpha(image.getchannel("A"))
+    return tinted
+
+
+def build_glyph_table_from_system_font(
+        selection: GlyphSelection = ASCII_WITH_LATIN_1,
+        font_name: str = DEFAULT_FONT_NAME,
+        font_size: int = DEFAULT_FONT_SIZE,
+        font_color: Color = arcade.color.WHITE,
+        map_lower_to_upper: bool = False) -> TextureTable:
+    """
+    Rasterize every glyph in the selection with a system font.
+
+    The whole selection is rasterized in one batch through pyglet's
+    font machinery, which reuses the loaded font face across all
+    glyphs instead of doing a full PIL text layout per character.
+
+    :param GlyphSelection selection: Which characters to include
+    :param str font_name: Name of the system font to use
+    :param int font_size: Size of the font in points
+    :param Color font_color: Color to render the glyphs with
+    :param bool map_lower_to_upper: Point lowercase keys at the
+                                    uppercase textures instead of
+                                    rasterizing them separately
+    :returns: A table mapping each character to its :class:`Texture`
+    """
+    flattened_selection = flatten_glyph_selection(selection)
+
+    render_selection = flattened_selection
+    if map_lower_to_upper:
+        # Don't rasterize lowercase letters whose uppercase is also in
+        # the selection: the remap below points both keys at the one
+        # uppercase Texture.
+        selection_set = set(flattened_selection)
+        render_selection = "".join(
+            char for char in flattened_selection
+            if not (char.islower() and char.upper() in selection_set))
+
+    # Seed the keys up front so filling the table overwrites slots
+    # instead of growing the dict through repeated rehashes
+    glyph_table: TextureTable = dict.fromkeys(render_selection)
+
+    try:
+        font = _load_pyglet_font(font_name, font_size)
+        glyphs = font.get_glyphs(render_selection)
+    except Exception:
+        # No GL context or font backend available: render each glyph
+        # through the slower PIL path instead. The renders are
+        # independent and PIL's rasterizer releases the GIL, so big
+        # selections are spread over a thread pool; small ones aren't
+        # worth the pool startup cost.
+        def render(char: str) -> Texture:
+            return render_glyph_texture_from_system_font(
+                char, font_name, font_size, font_color)
+
+        if len(render_selection) >= 32:
+            workers = min(8, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                textures = executor.map(render, render_selection)
+                glyph_table.update(zip(render_selection, textures))
+        else:
+            for char in render_selection:
+                glyph_table[char] = render(char)
+    else:
+        # Color belongs in the names: SpriteList atlases deduplicate
+        # textures by name, so two colors of one glyph must not
+        # collide. Normalized once since Color values may be lists.
+        color_key = tuple(font_color)
+        for char, glyph in zip(render_selection, glyphs):
+            image = _glyph_image_from_pyglet(glyph)
+            image = _tint_glyph_image(image, font_color)
+            tex_name = (f"glyph-{font_name}-{font_size}-"
+                        f"{color_key}-{ord(char):#x}")
+            glyph_table[char] = Texture(tex_name, image,
+                                        hit_box_algorithm="None")
+
+    if map_lower_to_upper:
+        # Include non-ASCII here: the render skip above may have
+        # dropped lowercase glyphs beyond ASCII
+        remap_font_glyph_table_lowercase_to_upper(glyph_table,
+                                                  include_non_ascii=True)
+    return glyph_table
+
+
+def build_glyph_table_from_code_range(
+        range_start: int = 0,
+        range_stop: int = 256,
+        font_name: str = DEFAULT_FONT_NAME,
+        font_size: int = DEFAULT_FONT_SIZE,
+        font_color: Color = arcade.color.WHITE) -> TextureTable:
+    """
+    Rasterize the glyphs for a range of unicode code points.
+
+    :param int range_start: First code point, inclusive
+    :param int range_stop: Last code point, exclusive
+    :returns: A table mapping each character to its :class:`Texture`
+    """
+    # Expand the code points in C rather than one chr() call each:
+    # ranges within latin-1 are a straight bytes decode, wider ones
+    # run chr through map's C loop.
+    if range_stop <= 256:
+        selection = bytes(range(range_start, range_stop)).decode("latin-1")
+    else:
+        selection = "".join(map(chr, range(range_start, range_stop)))
+    return build_glyph_table_from_system_font(
+        selection, font_name, font_size, font_color)
+
+
+# The ASCII case mapping is fixed, so build it once instead of running
+# Unicode property checks over every key of every remapped table.
+_ASCII_UPPER_TO_LOWER = {upper: upper.lower()
+                         for upper in string.ascii_uppercase}
+
+
+def remap_font_glyph_table_lowercase_to_upper(
+        glyph_table: TextureTable,
+        include_non_ascii: bool = False) -> TextureTable:
+    """
+    Point lowercase keys at the uppercase textures in the same table.
+    Useful for fonts or spritesheets that only include capitals.
+
+    :param TextureTable glyph_table: Table to remap in place
+    :param bool include_non_ascii: Also walk the table for capitals
+                                   outside ASCII. Off by default so
+                                   the common case never touches more
+                                   than the 26 ASCII letters.
+    :returns: The same table
+    """
+    # Constant 26-entry pass over the precomputed ASCII map: one O(1)
+    # .get per letter instead of isupper()/lower() on every key
+    for upper, lower in _ASCII_UPPER_TO_LOWER.items():
+        texture = glyph_table.get(upper)
+        if texture is not None:
+            glyph_table[lower] = texture
+
+    if include_non_ascii:
+        for character in list(glyph_table):
+            if ord(character) > 127 and character.isupper():
+                glyph_table[character.lower()] = glyph_table[character]
+    return glyph_table
+
+
+def load_monospace_spritesheet_font(
+        file_name,
+        sprite_width: int,
+        sprite_height: int,
+        columns: int,
+        selection: GlyphSelection = ASCII_WITH_LATIN_1,
+        margin: int = 0,
+        map_lower_to_upper: bool = False) -> TextureTable:
+    """
+    Slice a monospace spritesheet into a texture table. The sheet is
+    expected to hold one tile per character of the selection, in
+    selection order.
+
+    :param file_name: Spritesheet to load
+    :param int sprite_width: Width of each tile in pixels
+    :param int sprite_height: Height of each tile in pixels
+    :param int columns: Number of tiles per sheet row
+    :param GlyphSelection selection: Characters the sheet covers
+    :param int margin: Margin between tiles
+    :param bool map_lower_to_upper: Alias lowercase keys to the
+                                    uppercase tiles
+    :returns: A table mapping each character to its :class:`Texture`
+    """
+    flat_selection = flatten_glyph_selection(selection)
+    raw_sheet = arcade.load_spritesheet(
+        file_name, sprite_width, sprite_height, columns,
+        len(flat_selection), margin)
+
+    # Seeding the keys presizes the dict, avoiding rehashes mid-fill
+    texture_table: TextureTable = dict.fromkeys(flat_selection)
+    for index, character in enumerate(flat_selection):
+        texture_table[character] = raw_sheet[index]
+
+    if map_lower_to_upper:
+        remap_font_glyph_table_lowercase_to_upper(texture_table,
+                                                  include_non_ascii=True)
+
+    return texture_table
+
+
+class GlyphAtlas:
+    """
+    A whole glyph table packed into one texture.
+
+    Attributes:
+        :texture: The shared atlas :class:`Texture`.
+        :rects: Maps each character to its (x, y, width, height)
+                pixel rectangle inside the atlas image.
+    """
+
+    def __init__(self, texture: Texture, rects: GlyphRects):
+        self.texture = texture
+        self.rects = rects
+
+
+def pack_glyph_atlas(glyph_table: TextureTable,
+                     atlas_width: int = 512,
+                     name: str = "glyph-atlas") -> GlyphAtlas:
+    """
+    Shelf-pack every texture in a glyph table into a single atlas.
+
+    Rather than one small texture (and one draw) per character, all
+    glyphs share one texture and are referenced by pixel rectangle.
+    Glyphs are placed tallest-first so each shelf row wastes as little
+    vertical space as possible.
+
+    :param TextureTable glyph_table: Table of textures to pack
+    :param int atlas_width: Fixed width of the atlas in pixels
+    :param str name: Name for the atlas :class:`Texture`
+    :returns: A :class:`GlyphAtlas`
+    """
+    # Tallest glyphs first so each shelf is as tight as possible
+    items = sorted(glyph_table.items(),
+                   key=lambda item: item[1].image.height,
+                   reverse=True)
+
+    # First pass: assign rectangles with a simple shelf walk
+    rects: GlyphRects = {}
+    cursor_x = 0
+    cursor_y = 0
+    shelf_height = 0
+    for character, texture in items:
+        width = texture.image.width
+        height = texture.image.height
+        if width > atlas_width:
+            raise ValueError(
+                f"Glyph {character!r} is wider ({width}px) than the "
+                f"atlas ({atlas_width}px)")
+        if cursor_x + width > atlas_width:
+            # Start a new shelf
+            cursor_y += shelf_height
+            cursor_x = 0
+            shelf_height = 0
+        rects[character] = (cursor_x, cursor_y, width, height)
+        cursor_x += width
+        if height > shelf_height:
+            shelf_height = height
+    atlas_height = cursor_y + shelf_height
+
+    # Second pass: paste every glyph into one image
+    atlas_image = PIL.Image.new("RGBA", (atlas_width, atlas_height))
+    for character, texture in items:
+        x, y, _width, _height = rects[character]
+        atlas_image.paste(texture.image, (x, y))
+
+    return GlyphAtlas(Texture(name, atlas_image, hit_box_algorithm="None"),
+                      rects)
+
+
+def pack_tables_into_atlas(tables: Iterable[TextureTable],
+                           atlas_width: int = 512,
+                           name: str = "glyph-atlas") -> GlyphAtlas:
+    """
+    Shelf-pack several texture tables into one shared atlas.
+
+    Mixing tables with different glyph heights wastes vertical space
+    if each is packed separately; merging them first lets the
+    tallest-first shelf packing interleave the heights into fewer,
+    tighter rows. When the same character appears in more than one
+    table, the last table wins.
+
+    :param tables: The :data:`TextureTable` dicts to combine
+    :param int atlas_width: Fixed width of the atlas in pixels
+    :param str name: Name for the atlas :class:`Texture`
+    :returns: A :class:`GlyphAtlas` covering every table
+    """
+    merged: TextureTable = {}
+    for table in tables:
+        merged.update(table)
+    return pack_glyph_atlas(merged, atlas_width=atlas_width, name=name)
+
+
+# Rasterized atlases are cached on disk so later runs pay one PNG
+# decode instead of re-rasterizing the whole selection.
+ATLAS_CACHE_DIR = Path.home() / ".arcade" / "glyph-atlas-cache"
+
+
+def _atlas_cache_key(selection: str,
+                     font_name: str,
+                     font_size: int,
+                     font_color: Color,
+                     atlas_width: int) -> str:
+    """ Hash the atlas build parameters into a short file-name key. """
+    color = arcade.get_four_byte_color(font_color)
+    raw = f"{font_name}|{font_size}|{tuple(color)}|{atlas_width}|{selection}"
+    return hashlib.blake2b(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _load_cached_atlas(key: str, name: str) -> Optional[GlyphAtlas]:
+    """
+    Load a cached atlas, or ``None`` if it is absent or unreadable.
+    """
+    image_path = ATLAS_CACHE_DIR / f"{key}.png"
+    rects_path = ATLAS_CACHE_DIR / f"{key}.json"
+    try:
+        with PIL.Image.open(image_path) as image_file:
+            atlas_image = image_file.convert("RGBA")
+        with rects_path.open() as rects_file:
+            raw_rects = json.load(rects_file)
+        rects: GlyphRects = {character: tuple(rect)
+                             for character, rect in raw_rects.items()}
+    except (OSError, ValueError):
+        # Missing or corrupt cache entries just mean a rebuild
+        return None
+    return GlyphAtlas(Texture(name, atlas_image, hit_box_algorithm="None"),
+                      rects)
+
+
+def _store_cached_atlas(key: str, atlas: GlyphAtlas) -> None:
+    """
+    Write an atlas to the disk cache. Failures are ignored; the cache
+    is an optimization, not a requirement.
+    """
+    try:
+        ATLAS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write to temp names and rename so a crash mid-write can't
+        # leave a truncated cache entry behind.
+        image_path = ATLAS_CACHE_DIR / f"{key}.png"
+        rects_path = ATLAS_CACHE_DIR / f"{key}.json"
+        temp_image_path = ATLAS_CACHE_DIR / f"{key}.png.tmp"
+        temp_rects_path = ATLAS_CACHE_DIR / f"{key}.json.tmp"
+        atlas.texture.image.save(temp_image_path, "PNG")
+        with temp_rects_path.open("w") as rects_file:
+            json.dump({character: list(rect)
+                       for character, rect in atlas.rects.items()},
+                      rects_file)
+        os.replace(temp_image_path, image_path)
+        os.replace(temp_rects_path, rects_path)
+    except OSError:
+        pass
+
+
+def build_glyph_atlas_from_system_font(
+        selection: GlyphSelection = ASCII_WITH_LATIN_1,
+        font_name: str = DEFAULT_FONT_NAME,
+        font_size: int = DEFAULT_FONT_SIZE,
+        font_color: Color = arcade.color.WHITE,
+        atlas_width: int = 512,
+        use_disk_cache: bool = True) -> GlyphAtlas:
+    """
+    Rasterize a glyph selection and pack it straight into one atlas
+    texture.
+
+    The result is deterministic for a given set of arguments, so it is
+    cached under :data:`ATLAS_CACHE_DIR`. A cached build replaces the
+    per-glyph rasterization and packing with a single PNG decode.
+
+    :param bool use_disk_cache: Load/store the atlas on disk
+    :returns: A :class:`GlyphAtlas`
+    """
+    flat_selection = flatten_glyph_selection(selection)
+    name = f"glyph-atlas-{font_name}-{font_size}"
+
+    key = None
+    if use_disk_cache:
+        key = _atlas_cache_key(flat_selection, font_name, font_size,
+                               font_color, atlas_width)
+        cached = _load_cached_atlas(key, name)
+        if cached is not None:
+            return cached
+
+    glyph_table = build_glyph_table_from_system_font(
+        flat_selection, font_name, font_size, font_color)
+    atlas = pack_glyph_atlas(glyph_table, atlas_width=atlas_width, name=name)
+
+    if key is not None:
+        _store_cached_atlas(key, atlas)
+    return atlas
+
+
+# DEFAULT_GLYPH_FONT is built lazily through the module __getattr__
+# below (PEP 562): rasterizing 256 glyphs at import time would stall
+# every import of this module whether or not the table is used.
+_default_glyph_font = None
+
+
+def __getattr__(name: str):
+    if name == "DEFAULT_GLYPH_FONT":
+        global _default_glyph_font
+        if _default_glyph_font is None:
+            _default_glyph_font = build_glyph_table_from_system_font()
+        return _default_glyph_font
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
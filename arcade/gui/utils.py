@@ -56,7 +56,8 @@ def parse_value(value: Any):
         # hex
         if len(value) in (3, 6) and "," not in value:
             try:
-                return getrgb(f"#{value}")
+                # Styles expect plain RGB for these alpha-less forms
+                return arcade.color_from_hex_string(value)[:3]
             except ValueError:
                 pass
 
@@ -1,5 +1,44 @@
+import pytest
+
 import arcade
 
+def test_get_points_for_thick_lines():
+    starts = [(0, 0), (10, 10), (5, 5)]
+    ends = [(10, 0), (10, 20), (5, 5)]
+    widths = [2, 4, 2]
+
+    points = arcade.get_points_for_thick_lines(starts, ends, widths)
+
+    assert points.shape == (3, 4, 2)
+    for index in range(3):
+        expected = arcade.get_points_for_thick_line(starts[index][0],
+                                                    starts[index][1],
+                                                    ends[index][0],
+                                                    ends[index][1],
+                                                    widths[index])
+        for corner in range(4):
+            assert points[index][corner][0] == expected[corner][0]
+            assert points[index][corner][1] == expected[corner][1]
+
+def test_color_from_hex_string():
+    assert arcade.color_from_hex_string("#ff0000") == (255, 0, 0, 255)
+    assert arcade.color_from_hex_string("00ff00") == (0, 255, 0, 255)
+    assert arcade.color_from_hex_string("#ffffff00") == (255, 255, 255, 0)
+    assert arcade.color_from_hex_string("fff") == (255, 255, 255, 255)
+    assert arcade.color_from_hex_string("#f00f") == (255, 0, 0, 255)
+
+    with pytest.raises(ValueError):
+        arcade.color_from_hex_string("fffff")
+    with pytest.raises(ValueError):
+        arcade.color_from_hex_string("zzzzzz")
+    # Whitespace passes the length checks but decodes short
+    with pytest.raises(ValueError):
+        arcade.color_from_hex_string("ff 00 00")
+    with pytest.raises(ValueError):
+        arcade.color_from_hex_string("f f")
+    with pytest.raises(ValueError):
+        arcade.color_from_hex_string("#")
+
 def test_rotate_point():
     x = 0
     y = 0
@@ -0,0 +1,333 @@
+"""
+Implementation behind doc_helpers. Import that module instead; it
+loads this one lazily on first attribute access.
+"""
+import os
+import re
+import sys
+from collections import abc
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Final, Iterable, Optional
+
+# The literal compiles straight to the interned empty-tuple constant,
+# so identity checks against this name (arg is EMPTY_TUPLE) are valid
+# and callers can skip defensive truthiness tests.
+EMPTY_TUPLE: Final[tuple] = ()
+
+
+def is_iterable(item) -> bool:
+    """
+    Report whether ``item`` is iterable.
+
+    The ABC check is answered by a cached C-level subclass hook, so
+    non-iterables cost no exception raise/catch cycle; safe for tight
+    filter loops.
+
+    :param item: Any object
+    :returns: Whether the item can be iterated
+    """
+    return isinstance(item, abc.Iterable)
+
+
+def is_iterable_strict(item) -> bool:
+    """
+    Report whether ``iter(item)`` actually succeeds.
+
+    Slower than :func:`is_iterable`, but also covers objects whose
+    ``__iter__`` exists and then fails when called.
+
+    :param item: Any object
+    :returns: Whether iter() returns an iterator for the item
+    """
+    try:
+        iter(item)
+    except Exception:
+        return False
+    return True
+
+
+class NotExcludedBy:
+    """
+    Callable predicate: true when an item is not in the exclusion set.
+
+    Built for tight filter loops over identifiers, so the exclusion
+    collection is frozen once and membership goes through a
+    pre-bound ``__contains__``. String items are interned so the set
+    probe usually resolves on pointer identity.
+    """
+
+    def __init__(self, collection: Iterable):
+        self.items = frozenset(
+            sys.intern(item) if isinstance(item, str) else item
+            for item in collection)
+        # Bind once so each call pays a local load instead of an
+        # attribute lookup
+        self._contains = self.items.__contains__
+
+    def __call__(self, item) -> bool:
+        return not self._contains(item)
+
+
+# One realpath call for the whole module; everything in SharedPaths
+# derives from it by string-level parent traversal and joins.
+_RESOLVED_FILE = Path(__file__).resolve()
+
+
+class SharedPaths:
+    """ Repo locations the doc scripts care about. Resolved once. """
+    REPO_UTILS_DIR = _RESOLVED_FILE.parents[0]
+    REPO_ROOT = _RESOLVED_FILE.parents[1]
+    ARCADE_ROOT = REPO_ROOT / "arcade"
+    DOC_ROOT = REPO_ROOT / "doc"
+
+    # Cached string forms, in the order above, for hot loops that
+    # hand paths straight to open() without __fspath__ dispatch
+    as_strs = tuple(str(path) for path in (
+        REPO_UTILS_DIR, REPO_ROOT, ARCADE_ROOT, DOC_ROOT))
+
+
+# What counts as a valid dotted-path segment. The happy path
+# validates the whole module with one fullmatch of the repeat-group
+# form; the per-segment pattern only runs on the error path to name
+# the offending segment.
+_VALID_MODULE_SEGMENT = re.compile(r"[_a-zA-Z][_a-z0-9]*", re.ASCII)
+_VALID_MODULE_PATH = re.compile(
+    r"[_a-zA-Z][_a-z0-9]*(?:\.[_a-zA-Z][_a-z0-9]*)*", re.ASCII)
+
+
+# re.compile's internal cache still hashes a key tuple and probes a
+# dict per call; a direct lru_cache wrapper keeps the handful of
+# patterns the doc scripts reuse one lookup away.
+_compile_str = lru_cache(maxsize=128)(re.compile)
+
+
+def ensure_pattern(pattern) -> "re.Pattern":
+    """
+    Pass through compiled regex patterns and compile strings.
+
+    :param pattern: A regex source string or a compiled pattern
+    :returns: The compiled :class:`re.Pattern`
+    """
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    if isinstance(pattern, str):
+        return _compile_str(pattern)
+    raise TypeError(
+        f"Expected a str or compiled regex pattern, but got {pattern!r}")
+
+
+# Every ParseKind subclass keyed by its autodoc directive. Filled in
+# during class creation, so directive lookups are one dict probe and
+# never scan ParseKind.__subclasses__().
+kind_to_sphinx_directive: Dict[str, type] = {}
+
+
+class ParseKind:
+    """
+    Base class for one kind of identifier the doc scripts pull out of
+    source files.
+
+    Subclasses bind ``pattern`` to a regex matching their kind; each
+    match becomes an instance wrapping the matched text. The Sphinx
+    directive names are derived from the subclass name unless
+    overridden as class keywords.
+    """
+
+    __slots__ = ("name",)
+
+    pattern = None
+
+    def __init_subclass__(cls,
+                          pattern=None,
+                          crossref_directive=None,
+                          autodoc_directive=None,
+                          **kwargs):
+        super().__init_subclass__(**kwargs)
+        if pattern is not None:
+            cls.pattern = ensure_pattern(pattern)
+        auto_name = cls.__name__.lower()
+        # Interned so directive comparisons and registry probes can
+        # resolve on pointer identity
+        cls.crossref_directive = sys.intern(
+            crossref_directive or auto_name)
+        cls.autodoc_directive = sys.intern(
+            autodoc_directive or f"auto{auto_name}")
+        kind_to_sphinx_directive[cls.autodoc_directive] = cls
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name!r})"
+
+    @classmethod
+    def new(cls, name: str, pattern,
+            crossref_directive=None, autodoc_directive=None):
+        """
+        Create a subclass without a class statement.
+
+        Repeat calls with the same arguments return the same class
+        object instead of re-running class creation.
+
+        :param str name: Name for the new subclass
+        :param pattern: Regex source or compiled pattern for matches
+        :returns: The new :class:`ParseKind` subclass
+        """
+        pattern = ensure_pattern(pattern)
+        return _new_parse_kind(cls, name, pattern.pattern, pattern.flags,
+                               crossref_directive, autodoc_directive)
+
+    @classmethod
+    def _from_name(cls, name: str):
+        """ Build an instance without dispatching through __init__. """
+        instance = cls.__new__(cls)
+        instance.name = name
+        return instance
+
+    @classmethod
+    def finditer(cls, source: str):
+        """
+        Lazily yield one instance per match in ``source``.
+
+        Streaming callers (counting, writing matches out) should use
+        this form: it never materializes the whole match list.
+
+        :param str source: Text to scan for this kind
+        :returns: A generator of instances
+        """
+        pattern = cls.pattern
+        if pattern is None:
+            raise TypeError(
+                f"{cls.__name__} has no pattern; scan with a "
+                f"ParseKind subclass that sets one")
+        # The per-match construction path skips __init__ dispatch:
+        # one slot write per match instead of a full frame
+        from_name = cls._from_name
+        return (from_name(match.group(0))
+                for match in pattern.finditer(source))
+
+    @classmethod
+    def findall(cls, source: str):
+        """
+        Return every match in ``source`` as a list of instances.
+
+        :param str source: Text to scan for this kind
+        :returns: A list of instances
+        """
+        return list(cls.finditer(source))
+
+
+# Identical ParseKind.new calls (common when tooling reloads modules)
+# would otherwise build a fresh class each time, re-registering it and
+# growing __subclasses__. The cache keys on the pattern's source and
+# flags so equivalent compiled patterns share one class.
+@lru_cache(maxsize=None)
+def _new_parse_kind(base: type, name: str,
+                    pattern_source: str, pattern_flags: int,
+                    crossref_directive, autodoc_directive):
+    """ Build and memoize one dynamically created ParseKind subclass. """
+    return type(name, (base,), {},
+                pattern=re.compile(pattern_source, pattern_flags),
+                crossref_directive=crossref_directive,
+                autodoc_directive=autodoc_directive)
+
+
+@lru_cache(maxsize=None)
+def _source_file_index(root: Path) -> frozenset:
+    """
+    Walk ``root`` once and collect every ``.py`` path below it.
+
+    Paths are POSIX-style strings relative to ``root``. Resolving
+    modules against this set answers existence checks with zero
+    syscalls instead of two stats per module.
+    """
+    found = []
+
+    def scan(directory: str, prefix: str):
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name.startswith('.') or name == "__pycache__":
+                        continue
+                    scan(entry.path, f"{prefix}{name}/")
+                elif name.endswith(".py"):
+                    found.append(prefix + name)
+
+    scan(str(root), "")
+    return frozenset(found)
+
+
+@lru_cache(maxsize=None)
+def get_module_path(module: str, root: Optional[Path] = None) -> Path:
+    """
+    Resolve a dotted module name to the file that implements it.
+
+    Doc builds resolve the same modules over and over (once per
+    cross-reference, once per autodoc entry), and every resolution
+    costs filesystem stats, so results are memoized per
+    (module, root). Use ``get_module_path.cache_clear()`` if the tree
+    changes mid-run.
+
+    :param str module: Dotted module path such as ``"arcade.gui.utils"``
+    :param Path root: Directory holding the top-level package.
+                      Defaults to the repo root.
+    :returns: Path of the module's ``.py`` file, or the package's
+              ``__init__.py``
+    """
+    if root is None:
+        root = SharedPaths.REPO_ROOT
+
+    if not _VALID_MODULE_PATH.fullmatch(module):
+        # Re-scan segment by segment only on failure, so the error
+        # still names the offending segment
+        for index, part in enumerate(module.split('.')):
+            if not _VALID_MODULE_SEGMENT.fullmatch(part):
+                raise ValueError(
+                    f"Invalid segment {part!r} "
+                    f"at index {index} of {module!r}")
+        raise ValueError(f"Invalid module {module!r}")
+    parts = module.split('.')
+
+    # The whole hot path works on strings: existence checks go to the
+    # one-shot file index, and the two candidate names are plain
+    # joins. A Path is only constructed for the winning candidate at
+    # the return boundary.
+    file_index = _source_file_index(root)
+    relative = "/".join(parts)
+    package_init = f"{relative}/__init__.py"
+    module_file = f"{relative}.py"
+    have_package = package_init in file_index
+    have_file = module_file in file_index
+
+    if have_package and have_file:
+        raise ValueError(
+            f"{module!r} is both a package and a plain module")
+    if have_package:
+        return root / package_init
+    if have_file:
+        return root / module_file
+    raise ValueError(f"No source found for {module!r} under {root}")
+
+
+def get_module_paths(modules: Iterable[str],
+                     root: Optional[Path] = None) -> Dict[str, Path]:
+    """
+    Resolve many dotted module names in one pass.
+
+    Building the file index is the fixed cost of resolution; batching
+    amortizes it over the whole list, which is how the API doc table
+    should consume these lookups.
+
+    :param modules: Dotted module paths to resolve
+    :param Path root: Directory holding the top-level package.
+                      Defaults to the repo root.
+    :returns: A dict mapping each module name to its source file
+    """
+    if root is None:
+        root = SharedPaths.REPO_ROOT
+    # Warm the index once up front so every lookup below is pure
+    # set membership
+    _source_file_index(root)
+    return {module: get_module_path(module, root) for module in modules}
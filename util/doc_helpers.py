@@ -0,0 +1,33 @@
+"""
+Shared helpers for the documentation build scripts in this directory.
+
+The implementation lives in _doc_helpers_impl and is loaded on first
+attribute access (PEP 562). Scripts that import this module without
+touching path resolution or parsing skip the re/pathlib imports, the
+regex compiles, and the repo-root realpath call entirely.
+"""
+
+__all__ = [
+    "EMPTY_TUPLE",
+    "NotExcludedBy",
+    "ParseKind",
+    "SharedPaths",
+    "ensure_pattern",
+    "get_module_path",
+    "get_module_paths",
+    "is_iterable",
+    "is_iterable_strict",
+    "kind_to_sphinx_directive",
+]
+
+
+def __getattr__(name):
+    import _doc_helpers_impl
+    try:
+        value = getattr(_doc_helpers_impl, name)
+    except AttributeError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}") from None
+    # Cache on this module so later accesses bypass __getattr__
+    globals()[name] = value
+    return value